@@ -17,7 +17,7 @@ DTCs Implemented (Yanmar/OBD-II compatible):
 """
 
 import time
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Set, Tuple
 from collections import deque
 
 
@@ -74,6 +74,9 @@ class YSMAI_EnhancedAgent:
     # State order for progression tracking
     STATE_ORDER = [S0_IDLE, S1_WARMUP, S2_NORMAL, S3_WARNING, S4_CRITICAL, S5_SHUTDOWN]
     
+    # Integer rank per state so escalation is a dict lookup, not a list scan
+    STATE_RANK = {s: rank for rank, s in enumerate(STATE_ORDER)}
+    
     # Severity mapping for UI
     STATE_SEVERITY = {
         S0_IDLE: "INFO",
@@ -145,11 +148,20 @@ class YSMAI_EnhancedAgent:
         
         # Active DTCs
         self.active_dtcs: List[Tuple[str, str, float]] = []  # (code, desc, timestamp)
+        self._active_dtc_codes: Set[str] = set()  # Codes in active_dtcs, for O(1) lookup
         
         # Drift analysis (sliding window)
         self.temp_history: deque = deque(maxlen=drift_window_size)
         self.time_history: deque = deque(maxlen=drift_window_size)
         
+        # Running regression sums over the window; times are taken relative to
+        # the first sample so squared unix timestamps don't swamp the slope
+        self._drift_t0: Optional[float] = None
+        self._sum_t = 0.0
+        self._sum_temp = 0.0
+        self._sum_t_temp = 0.0
+        self._sum_t_sq = 0.0
+        
         # Sensor values cache for multi-sensor analysis
         self.last_sensors = {
             "temperature": 70.0,
@@ -200,17 +212,22 @@ class YSMAI_EnhancedAgent:
             "rpm": rpm,
         }
         
-        # Update drift tracking
-        self._update_drift_tracking(temperature, timestamp_unix)
-        
         # Determine desired state and check for DTCs
         desired_state, detected_dtcs = self._compute_desired_state_and_dtcs(
             temperature, oil_pressure_psi, vibration_mms, voltage_v, rpm
         )
         
+        # Update drift tracking; the warm-up ramp is expected, not drift, so
+        # the window is restarted until warm-up is over
+        if self.S1_WARMUP in (desired_state, self.current_state):
+            self._reset_drift_tracking()
+        else:
+            self._update_drift_tracking(temperature, timestamp_unix)
+        
         # Add new DTCs
         for dtc_code, dtc_desc in detected_dtcs:
-            if not any(d[0] == dtc_code for d in self.active_dtcs):
+            if dtc_code not in self._active_dtc_codes:
+                self._active_dtc_codes.add(dtc_code)
                 self.active_dtcs.append((dtc_code, dtc_desc, timestamp_unix))
                 new_dtcs.append((dtc_code, dtc_desc))
         
@@ -258,25 +275,50 @@ class YSMAI_EnhancedAgent:
             "estimated_rul_display": self._format_rul(self.estimated_rul_seconds),
         }
     
+    def _reset_drift_tracking(self) -> None:
+        """Empty the drift window and running sums."""
+        self.temp_history.clear()
+        self.time_history.clear()
+        self._drift_t0 = None
+        self._sum_t = 0.0
+        self._sum_temp = 0.0
+        self._sum_t_temp = 0.0
+        self._sum_t_sq = 0.0
+        self.drift_rate = 0.0
+    
     def _update_drift_tracking(self, temperature: float, timestamp: float) -> None:
         """Track temperature history for drift calculation."""
+        if self._drift_t0 is None:
+            self._drift_t0 = timestamp
+        
+        # Remove the sample about to be evicted from the running sums
+        if len(self.temp_history) == self.temp_history.maxlen:
+            old_t = self.time_history[0] - self._drift_t0
+            old_temp = self.temp_history[0]
+            self._sum_t -= old_t
+            self._sum_temp -= old_temp
+            self._sum_t_temp -= old_t * old_temp
+            self._sum_t_sq -= old_t * old_t
+        
         self.temp_history.append(temperature)
         self.time_history.append(timestamp)
         
-        if len(self.temp_history) >= 2:
+        t = timestamp - self._drift_t0
+        self._sum_t += t
+        self._sum_temp += temperature
+        self._sum_t_temp += t * temperature
+        self._sum_t_sq += t * t
+        
+        # Only estimate over a full window, so a restart after warm-up does not
+        # report a slope from the last few ramp samples
+        n = len(self.temp_history)
+        if n < self.temp_history.maxlen:
+            self.drift_rate = 0.0
+        else:
             # Calculate drift rate (linear regression slope)
-            temps = list(self.temp_history)
-            times = list(self.time_history)
-            
-            n = len(temps)
-            sum_t = sum(times)
-            sum_temp = sum(temps)
-            sum_t_temp = sum(t * temp for t, temp in zip(times, temps))
-            sum_t_sq = sum(t * t for t in times)
-            
-            denominator = n * sum_t_sq - sum_t * sum_t
+            denominator = n * self._sum_t_sq - self._sum_t * self._sum_t
             if abs(denominator) > 1e-10:
-                self.drift_rate = (n * sum_t_temp - sum_t * sum_temp) / denominator
+                self.drift_rate = (n * self._sum_t_temp - self._sum_t * self._sum_temp) / denominator
             else:
                 self.drift_rate = 0.0
     
@@ -325,9 +367,8 @@ class YSMAI_EnhancedAgent:
         
         def escalate_state(new_state: str) -> str:
             """Escalate to higher severity state."""
-            current_idx = self.STATE_ORDER.index(state)
-            new_idx = self.STATE_ORDER.index(new_state)
-            return self.STATE_ORDER[max(current_idx, new_idx)]
+            rank = self.STATE_RANK
+            return new_state if rank[new_state] > rank[state] else state
         
         # === TEMPERATURE ANALYSIS ===
         if temp >= self.temp_shutdown:
@@ -410,14 +451,17 @@ class YSMAI_EnhancedAgent:
     
     def clear_dtc(self, dtc_code: str) -> bool:
         """Clear a specific DTC code."""
-        initial_len = len(self.active_dtcs)
+        if dtc_code not in self._active_dtc_codes:
+            return False
+        self._active_dtc_codes.discard(dtc_code)
         self.active_dtcs = [d for d in self.active_dtcs if d[0] != dtc_code]
-        return len(self.active_dtcs) < initial_len
+        return True
     
     def clear_all_dtcs(self) -> int:
         """Clear all active DTCs. Returns count cleared."""
         count = len(self.active_dtcs)
         self.active_dtcs = []
+        self._active_dtc_codes.clear()
         return count
     
     def get_state(self) -> str:
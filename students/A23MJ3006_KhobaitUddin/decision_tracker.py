@@ -9,15 +9,20 @@ Tracks all agent decisions for reporting:
 - Fault detections
 """
 
+import sys
 import time
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from collections import deque
 
 
-@dataclass
+# Slotted dataclasses (3.10+) drop the per-instance __dict__ for the decision log
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Decision:
     """Represents a single agent decision."""
     decision_id: str
@@ -73,6 +78,9 @@ class DecisionTracker:
     CAT_PREDICTIVE = "PREDICTIVE"
     CAT_SAFETY = "SAFETY"
     
+    # Largest unfiltered get_decisions() limit served from the cache
+    RECENT_CACHE_MAX_LIMIT = 5
+    
     def __init__(self, max_decisions: int = 500):
         """
         Initialize the decision tracker.
@@ -84,6 +92,10 @@ class DecisionTracker:
         self.decision_counter = 0
         self.session_start = time.time()
         
+        # Single-slot cache for the tick loop's recent-decisions query:
+        # (decision_counter, limit, result)
+        self._recent_cache: Optional[Tuple[int, int, List[Dict[str, Any]]]] = None
+        
         # Summary counters
         self.stats = {
             "total_decisions": 0,
@@ -353,7 +365,23 @@ class DecisionTracker:
         category: Optional[str] = None,
         severity: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Get decisions with optional filtering."""
+        """
+        Get decisions with optional filtering.
+        
+        Small unfiltered queries (the per-tick "recent decisions" lookup) are
+        cached until the next decision is logged. The returned list is fresh,
+        but the decision dicts in it are shared with the cache and must not
+        be mutated.
+        """
+        cacheable = (
+            limit <= self.RECENT_CACHE_MAX_LIMIT
+            and not (decision_type or category or severity)
+        )
+        if cacheable and self._recent_cache is not None:
+            counter, cached_limit, cached = self._recent_cache
+            if counter == self.decision_counter and cached_limit == limit:
+                return list(cached)
+        
         result = []
         
         for decision in reversed(self.decisions):
@@ -370,6 +398,9 @@ class DecisionTracker:
             if len(result) >= limit:
                 break
         
+        if cacheable:
+            self._recent_cache = (self.decision_counter, limit, result)
+            return list(result)
         return result
     
     def get_stats(self) -> Dict[str, Any]:
@@ -450,6 +481,7 @@ class DecisionTracker:
         self.decisions.clear()
         self.decision_counter = 0
         self.session_start = time.time()
+        self._recent_cache = None
         self.stats = {
             "total_decisions": 0,
             "by_type": {},
@@ -12,33 +12,51 @@ Models are persisted as .pkl files for inference.
 import os
 import json
 import pickle
+import functools
+import importlib.util
 import numpy as np
-from typing import Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, Optional, TYPE_CHECKING
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
-# Optional ML Libraries
-try:
+if TYPE_CHECKING:
     import pandas as pd
+
+# Optional ML Libraries (pandas is only needed to read Kaggle CSVs, so it is
+# located here but imported on first use)
+try:
     from sklearn.ensemble import RandomForestClassifier, IsolationForest
     from sklearn.linear_model import LinearRegression
     from sklearn.model_selection import train_test_split
     from sklearn.metrics import classification_report, mean_squared_error, r2_score, accuracy_score
+    if importlib.util.find_spec("pandas") is None:
+        raise ImportError("pandas")
     ML_AVAILABLE = True
 except ImportError:
     ML_AVAILABLE = False
     print("⚠️  ML libraries not available. Install with: pip install pandas scikit-learn")
 
-# Kaggle Support
-try:
-    import kagglehub
-    KAGGLE_AVAILABLE = True
-except ImportError:
-    KAGGLE_AVAILABLE = False
+# Kaggle Support (imported on first download)
+KAGGLE_AVAILABLE = importlib.util.find_spec("kagglehub") is not None
+if not KAGGLE_AVAILABLE:
     print("⚠️  Kaggle integration not available. Install with: pip install kagglehub")
 
 
+@functools.lru_cache(maxsize=None)
+def _pandas():
+    """Import pandas on first use; inference never needs it."""
+    import pandas as pd
+    return pd
+
+
+@functools.lru_cache(maxsize=None)
+def _kagglehub():
+    """Import kagglehub on first use; inference never needs it."""
+    import kagglehub
+    return kagglehub
+
+
 class MLModelTrainer:
     """
     Trains and manages ML models for enhanced YSMAI agent using real Kaggle datasets.
@@ -72,7 +90,7 @@ class MLModelTrainer:
     
     # ========== DATASET LOADING ==========
     
-    def load_engine_fault_data(self) -> Optional[pd.DataFrame]:
+    def load_engine_fault_data(self) -> Optional["pd.DataFrame"]:
         """Load Engine Fault Detection data from Kaggle."""
         if not KAGGLE_AVAILABLE:
             print("⚠️  Kaggle not available, using synthetic data for Fault Detector")
@@ -80,7 +98,7 @@ class MLModelTrainer:
         
         try:
             print("\n📥 Downloading Engine Fault Detection data from Kaggle...")
-            df = kagglehub.load_dataset(
+            df = _kagglehub().load_dataset(
                 "ziya07/engine-fault-detection-data",
                 path=""
             )
@@ -91,7 +109,7 @@ class MLModelTrainer:
             print("   Using synthetic data fallback...")
             return None
     
-    def load_bearing_data(self) -> Optional[pd.DataFrame]:
+    def load_bearing_data(self) -> Optional["pd.DataFrame"]:
         """Load NASA Bearing dataset from Kaggle."""
         if not KAGGLE_AVAILABLE:
             print("⚠️  Kaggle not available, using synthetic data for Vibration Detector")
@@ -99,13 +117,13 @@ class MLModelTrainer:
         
         try:
             print("\n📥 Downloading NASA Bearing dataset from Kaggle...")
-            path = kagglehub.dataset_download("vinayak123tyagi/bearing-dataset")
+            path = _kagglehub().dataset_download("vinayak123tyagi/bearing-dataset")
             print(f"✓ Downloaded to: {path}")
             
             # Load CSV files from the downloaded path
             csv_files = [f for f in os.listdir(path) if f.endswith('.csv')]
             if csv_files:
-                df = pd.read_csv(os.path.join(path, csv_files[0]))
+                df = _pandas().read_csv(os.path.join(path, csv_files[0]))
                 print(f"✓ Loaded {len(df)} records from Bearing dataset")
                 return df
             return None
@@ -114,7 +132,7 @@ class MLModelTrainer:
             print("   Using synthetic data fallback...")
             return None
     
-    def load_hydraulic_data(self) -> Optional[pd.DataFrame]:
+    def load_hydraulic_data(self) -> Optional["pd.DataFrame"]:
         """Load Hydraulic Systems Condition Monitoring data from Kaggle."""
         if not KAGGLE_AVAILABLE:
             print("⚠️  Kaggle not available, using synthetic data for Pressure Predictor")
@@ -122,13 +140,13 @@ class MLModelTrainer:
         
         try:
             print("\n📥 Downloading Hydraulic Systems dataset from Kaggle...")
-            path = kagglehub.dataset_download("jjacostupa/condition-monitoring-of-hydraulic-systems")
+            path = _kagglehub().dataset_download("jjacostupa/condition-monitoring-of-hydraulic-systems")
             print(f"✓ Downloaded to: {path}")
             
             # Load data files
             csv_files = [f for f in os.listdir(path) if f.endswith('.txt') or f.endswith('.csv')]
             if csv_files:
-                df = pd.read_csv(os.path.join(path, csv_files[0]), sep='\t' if csv_files[0].endswith('.txt') else ',')
+                df = _pandas().read_csv(os.path.join(path, csv_files[0]), sep='\t' if csv_files[0].endswith('.txt') else ',')
                 print(f"✓ Loaded {len(df)} records from Hydraulic Systems dataset")
                 return df
             return None
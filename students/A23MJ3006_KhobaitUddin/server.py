@@ -21,7 +21,33 @@ from controller_enhanced import EnhancedSimulationController
 from firebase_integration import get_firebase_manager
 from session_manager import get_session_manager
 
+# Optional fast JSON encoding for API responses
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("⚠️  orjson not installed, using default JSON encoder. Install with: pip install orjson")
+
+
+if ORJSON_AVAILABLE:
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson (compact, unsorted output)."""
+        
+        def dumps(self, obj, **kwargs):
+            # indent/separators from jsonify are ignored; output is always compact
+            return orjson.dumps(
+                obj, default=self.default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for React frontend
 
 # Global controller, Firebase, and SessionManager instances
@@ -12,7 +12,9 @@ Handles:
 
 import time
 import json
-from typing import Dict, Any, List, Optional
+from collections import deque
+from itertools import islice
+from typing import Dict, Any, Deque, List, Optional
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from uuid import uuid4
@@ -122,6 +124,7 @@ class SessionManager:
         self,
         checkpoint_interval_ticks: int = 600,  # ~5 minutes at 0.5s/tick
         auto_checkpoint_enabled: bool = True,
+        max_session_history: int = 100,
     ):
         """
         Initialize session manager.
@@ -129,6 +132,7 @@ class SessionManager:
         Args:
             checkpoint_interval_ticks: Ticks between auto-checkpoints
             auto_checkpoint_enabled: Enable automatic checkpointing
+            max_session_history: Maximum session summaries to keep in memory
         """
         self.checkpoint_interval_ticks = checkpoint_interval_ticks
         self.auto_checkpoint_enabled = auto_checkpoint_enabled
@@ -142,8 +146,8 @@ class SessionManager:
         self.last_checkpoint_tick = 0
         self.checkpoints: List[SessionCheckpoint] = []
         
-        # Session history
-        self.session_history: List[SessionSummary] = []
+        # Session history (oldest summaries evicted once full)
+        self.session_history: Deque[SessionSummary] = deque(maxlen=max_session_history)
         
         # Temperature tracking for statistics
         self.temperature_readings: List[float] = []
@@ -337,7 +341,10 @@ class SessionManager:
     
     def get_session_history(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent session summaries."""
-        return [s.to_dict() for s in self.session_history[-limit:]]
+        # Same start index as list[-limit:], without copying the deque
+        count = len(self.session_history)
+        start = max(0, count - limit) if limit > 0 else min(-limit, count)
+        return [s.to_dict() for s in islice(self.session_history, start, None)]
     
     def get_all_checkpoints(self, session_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get checkpoints for a session."""
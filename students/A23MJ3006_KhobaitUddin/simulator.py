@@ -4,6 +4,7 @@ TemperatureSimulator Module
 Simulates HVAC system temperature behavior with warmup phase, drift, and fault injection.
 """
 
+import math
 import time
 import random
 from typing import Optional
@@ -40,6 +41,10 @@ class TemperatureSimulator:
         self.warmup_duration_sec = warmup_duration_sec
         self.drift_rate = drift_rate
         
+        # Warmup curve constants (k ensures ~95% of the rise within warmup_duration)
+        self._warmup_k = 3.0 / warmup_duration_sec
+        self._warmup_span = target_operating_temp - initial_temp
+        
         # State variables
         self.current_temp = initial_temp
         self.elapsed_time = 0.0
@@ -59,17 +64,14 @@ class TemperatureSimulator:
         Returns:
             Current temperature in °F (range 50–120)
         """
-        import math
-        
         self.elapsed_time += elapsed_time_sec
         
         if self.elapsed_time <= self.warmup_duration_sec:
             # Warmup phase: exponential decay T(t) = T_amb + (T_op - T_amb) * (1 - e^(-kt))
             # Where T_amb = initial_temp, T_op = target operating temp, k = decay constant
-            T_amb = self.initial_temp
-            T_op = self.target_operating_temp  # Target operating temp (e.g., 180°F for marine engine)
-            k = 3.0 / self.warmup_duration_sec  # Decay constant ensures ~95% reached in warmup_duration
-            self.current_temp = T_amb + (T_op - T_amb) * (1 - math.exp(-k * self.elapsed_time))
+            self.current_temp = self.initial_temp + self._warmup_span * (
+                1 - math.exp(-self._warmup_k * self.elapsed_time)
+            )
         else:
             # Drift phase: apply drift after warmup
             drift_amount = self.drift_rate * self.drift_direction * elapsed_time_sec
@@ -1,7 +1,8 @@
 """
 Unit Tests for Core Modules
 
-Tests for TemperatureSimulator, YSMAI_Agent, and Scheduler classes.
+Tests for TemperatureSimulator, YSMAI_Agent, Scheduler, DecisionTracker,
+and YSMAI_EnhancedAgent drift tracking.
 """
 
 import unittest
@@ -9,6 +10,8 @@ import time
 from simulator import TemperatureSimulator
 from agent import YSMAI_Agent
 from scheduler import Scheduler
+from decision_tracker import DecisionTracker
+from agent_enhanced import YSMAI_EnhancedAgent
 
 
 class TestTemperatureSimulator(unittest.TestCase):
@@ -270,5 +273,122 @@ class TestScheduler(unittest.TestCase):
         self.assertEqual(tasks[0]["payload"], payload)
 
 
+class TestDecisionTracker(unittest.TestCase):
+    """Unit tests for DecisionTracker query caching."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tracker = DecisionTracker()
+    
+    def _log(self, tick, new_state="WARNING"):
+        return self.tracker.log_state_change(tick, "NORMAL", new_state, 222.0, 221.0)
+    
+    def test_recent_query_returns_fresh_list(self):
+        """Verify cached results are returned as a new list each call."""
+        self._log(1)
+        first = self.tracker.get_decisions(limit=5)
+        second = self.tracker.get_decisions(limit=5)
+        
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+    
+    def test_cache_invalidated_on_new_decision(self):
+        """Verify a newly logged decision is visible to the next query."""
+        self._log(1)
+        self.assertEqual(len(self.tracker.get_decisions(limit=5)), 1)
+        
+        latest = self._log(2, new_state="CRITICAL")
+        result = self.tracker.get_decisions(limit=5)
+        
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0]["decision_id"], latest.decision_id)
+    
+    def test_cache_invalidated_on_clear(self):
+        """Verify clear() drops cached results even when the counter repeats."""
+        self._log(1)
+        self.assertEqual(len(self.tracker.get_decisions(limit=5)), 1)
+        
+        self.tracker.clear()
+        self.assertEqual(self.tracker.get_decisions(limit=5), [])
+        
+        # Counter restarts at 1 after clear; the old result must not come back
+        self._log(7, new_state="CRITICAL")
+        result = self.tracker.get_decisions(limit=5)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["tick_count"], 7)
+    
+    def test_external_queries_not_cached(self):
+        """Verify large or filtered queries do not populate the cache."""
+        self._log(1)
+        self.tracker.get_decisions(limit=50)
+        self.tracker.get_decisions(limit=5, decision_type=DecisionTracker.TYPE_STATE_CHANGE)
+        self.tracker.get_decisions(limit=5, severity="CRITICAL")
+        
+        self.assertIsNone(self.tracker._recent_cache)
+
+
+class TestEnhancedAgentDrift(unittest.TestCase):
+    """Unit tests for YSMAI_EnhancedAgent drift tracking."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.agent = YSMAI_EnhancedAgent(drift_window_size=5)
+        self.start_time = 1.7e9  # Realistic unix timestamp
+    
+    def _window_slope(self):
+        """Least-squares slope recomputed from scratch over the current window."""
+        times = list(self.agent.time_history)
+        temps = list(self.agent.temp_history)
+        n = len(times)
+        t_mean = sum(times) / n
+        temp_mean = sum(temps) / n
+        num = sum((t - t_mean) * (y - temp_mean) for t, y in zip(times, temps))
+        den = sum((t - t_mean) ** 2 for t in times)
+        return num / den
+    
+    def test_slope_on_known_ramp(self):
+        """Verify a 0.1°F/s ramp at unix-scale timestamps reports 6°F/min."""
+        result = None
+        for i in range(5):
+            t = self.start_time + i * 0.5
+            result = self.agent.update(150.0 + 0.1 * (t - self.start_time), t)
+        
+        self.assertAlmostEqual(self.agent.drift_rate, 0.1, places=6)
+        self.assertEqual(result["drift_rate_per_min"], 6.0)
+    
+    def test_no_estimate_until_window_full(self):
+        """Verify drift stays at zero until the window is full."""
+        for i in range(4):
+            t = self.start_time + i * 0.5
+            result = self.agent.update(150.0 + i, t)
+            self.assertEqual(result["drift_rate_per_min"], 0.0)
+            self.assertIsNone(result["estimated_rul_seconds"])
+    
+    def test_eviction_at_maxlen(self):
+        """Verify running sums match a full recompute once samples are evicted."""
+        temp = 150.0
+        for i in range(12):
+            t = self.start_time + i * 0.5
+            temp += 0.05 if i < 5 else 0.25  # Slope changes mid-run
+            self.agent.update(temp, t)
+            
+            if i >= 4:
+                self.assertAlmostEqual(self.agent.drift_rate, self._window_slope(), places=6)
+        
+        # Window now holds only the steeper segment: 0.25°F per 0.5s
+        self.assertEqual(len(self.agent.temp_history), 5)
+        self.assertAlmostEqual(self.agent.drift_rate, 0.5, places=6)
+    
+    def test_no_estimate_during_warmup(self):
+        """Verify the warm-up ramp reports no drift or RUL."""
+        for i in range(10):
+            t = self.start_time + i * 0.5
+            result = self.agent.update(100.0 + 5.0 * i, t, rpm=1500)  # Below warm-up target
+            self.assertEqual(result["drift_rate_per_min"], 0.0)
+            self.assertIsNone(result["estimated_rul_seconds"])
+        
+        self.assertEqual(len(self.agent.temp_history), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,14 +3,15 @@
  * Displays current session status, checkpoint timeline, and session controls
  */
 
-import { useEffect, useState } from "react";
+import { memo, useEffect, useState } from "react";
 import { useSessionManager } from "@/hooks/useSessionManager";
 import { SessionCheckpoint } from "@/types/sessions";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { AlertCircle, Clock, Zap, Thermometer } from "lucide-react";
 
-export function SessionDashboard() {
+// Memoized: takes no props, so dashboard ticks do not re-render it
+export const SessionDashboard = memo(function SessionDashboard() {
   const {
     currentSession,
     sessionHistory,
@@ -284,4 +285,4 @@ export function SessionDashboard() {
       </div>
     </div>
   );
-}
+});
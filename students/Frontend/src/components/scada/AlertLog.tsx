@@ -1,20 +1,25 @@
+import { memo } from 'react';
 import { Card } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
 import { Alert } from '@/types/scada';
 import { Button } from '@/components/ui/button';
 
+// Built once; toLocaleTimeString would construct a new formatter for every row
+const timeFormatter = new Intl.DateTimeFormat('en-US', {
+  hour: '2-digit',
+  minute: '2-digit',
+  second: '2-digit',
+  hour12: false,
+});
+
 interface AlertLogProps {
   alerts: Alert[];
 }
 
-export const AlertLog = ({ alerts }: AlertLogProps) => {
+// Memoized: the alerts array only changes identity when a new alert is logged
+export const AlertLog = memo(({ alerts }: AlertLogProps) => {
   const formatTime = (timestamp: number) => {
-    return new Date(timestamp).toLocaleTimeString('en-US', {
-      hour: '2-digit',
-      minute: '2-digit',
-      second: '2-digit',
-      hour12: false,
-    });
+    return timeFormatter.format(timestamp);
   };
 
   const severityStyles = {
@@ -87,4 +92,4 @@ export const AlertLog = ({ alerts }: AlertLogProps) => {
       )}
     </Card>
   );
-};
+});
@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { memo, useState } from 'react';
 import { 
   FileText, 
   Download, 
@@ -20,7 +20,8 @@ interface ReportPanelProps {
   isLoading?: boolean;
 }
 
-export const ReportPanel = ({ 
+// Memoized: props only change on report actions, not on every tick
+export const ReportPanel = memo(({ 
   onGenerateReport, 
   onDownloadReport, 
   report, 
@@ -262,4 +263,4 @@ export const ReportPanel = ({
       )}
     </Card>
   );
-};
+});
@@ -1,3 +1,4 @@
+import { useMemo } from 'react';
 import { Card } from '@/components/ui/card';
 import { SensorData } from '@/types/scada';
 import {
@@ -10,35 +11,62 @@ import {
   XAxis,
   YAxis,
   CartesianGrid,
-  Tooltip,
   ResponsiveContainer,
   Legend,
 } from 'recharts';
 
+// Static chart props hoisted so Recharts sees stable references across ticks
+const AXIS_TICK = { fill: 'hsl(var(--muted-foreground))', fontSize: 10 };
+const PRESSURE_DOMAIN: [number, number] = [30, 55];
+const VIBRATION_DOMAIN: [number, number] = [0, 100];
+const RPM_DOMAIN: [number, number] = [0, 35];
+const VOLTAGE_DOMAIN: [number, number] = [10, 16];
+const BAR_RADIUS: [number, number, number, number] = [4, 4, 0, 0];
+
+const formatPressureTick = (v: number) => {
+  if (v === 0) return '-1h';
+  if (v === 30) return '-30m';
+  if (v === 59) return 'Now';
+  return '';
+};
+
 interface SecondaryChartsProps {
   data: SensorData[];
 }
 
+// Passive trend charts: no tooltips or animation, so ticks don't trigger
+// hover handlers or tween work. The main temperature chart stays interactive.
 export const SecondaryCharts = ({ data }: SecondaryChartsProps) => {
-  const pressureData = data.slice(-60).map((d, i) => ({
-    time: i,
-    pressure: d.oil_pressure_psi,
-  }));
+  const pressureData = useMemo(
+    () =>
+      data.slice(-60).map((d, i) => ({
+        time: i,
+        pressure: d.oil_pressure_psi,
+      })),
+    [data]
+  );
 
   // Use real vibration data from backend - showing frequency components derived from sensor readings
   const currentVib = data[data.length - 1]?.vibration_mms || 0;
-  const vibrationData = [
-    { frequency: '10Hz', amplitude: Math.max(0, currentVib * 0.3) },
-    { frequency: '50Hz', amplitude: Math.max(0, currentVib * 0.6) },
-    { frequency: '100Hz', amplitude: Math.max(0, currentVib * 0.4) },
-    { frequency: '500Hz', amplitude: Math.max(0, currentVib * 0.7) },
-  ];
+  const vibrationData = useMemo(
+    () => [
+      { frequency: '10Hz', amplitude: Math.max(0, currentVib * 0.3) },
+      { frequency: '50Hz', amplitude: Math.max(0, currentVib * 0.6) },
+      { frequency: '100Hz', amplitude: Math.max(0, currentVib * 0.4) },
+      { frequency: '500Hz', amplitude: Math.max(0, currentVib * 0.7) },
+    ],
+    [currentVib]
+  );
 
-  const rpmVoltageData = data.slice(-60).map((d, i) => ({
-    time: i,
-    rpm: d.rpm / 100,
-    voltage: d.voltage_v,
-  }));
+  const rpmVoltageData = useMemo(
+    () =>
+      data.slice(-60).map((d, i) => ({
+        time: i,
+        rpm: d.rpm / 100,
+        voltage: d.voltage_v,
+      })),
+    [data]
+  );
 
   return (
     <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
@@ -62,24 +90,12 @@ export const SecondaryCharts = ({ data }: SecondaryChartsProps) => {
                 dataKey="time"
                 axisLine={false}
                 tickLine={false}
-                tick={{ fill: 'hsl(var(--muted-foreground))', fontSize: 10 }}
-                tickFormatter={(v) => {
-                  if (v === 0) return '-1h';
-                  if (v === 30) return '-30m';
-                  if (v === 59) return 'Now';
-                  return '';
-                }}
-              />
-              <YAxis hide domain={[30, 55]} />
-              <Tooltip
-                contentStyle={{
-                  backgroundColor: 'hsl(var(--card))',
-                  border: '1px solid hsl(var(--border))',
-                  borderRadius: '6px',
-                }}
-                formatter={(value: number) => [`${value.toFixed(1)} PSI`, 'Pressure']}
+                tick={AXIS_TICK}
+                tickFormatter={formatPressureTick}
               />
+              <YAxis hide domain={PRESSURE_DOMAIN} />
               <Area
+                isAnimationActive={false}
                 type="monotone"
                 dataKey="pressure"
                 stroke="hsl(var(--warning))"
@@ -103,21 +119,14 @@ export const SecondaryCharts = ({ data }: SecondaryChartsProps) => {
                 dataKey="frequency"
                 axisLine={false}
                 tickLine={false}
-                tick={{ fill: 'hsl(var(--muted-foreground))', fontSize: 10 }}
-              />
-              <YAxis hide domain={[0, 100]} />
-              <Tooltip
-                contentStyle={{
-                  backgroundColor: 'hsl(var(--card))',
-                  border: '1px solid hsl(var(--border))',
-                  borderRadius: '6px',
-                }}
-                formatter={(value: number) => [`${value.toFixed(0)}%`, 'Amplitude']}
+                tick={AXIS_TICK}
               />
+              <YAxis hide domain={VIBRATION_DOMAIN} />
               <Bar
+                isAnimationActive={false}
                 dataKey="amplitude"
                 fill="hsl(var(--primary))"
-                radius={[4, 4, 0, 0]}
+                radius={BAR_RADIUS}
               />
             </BarChart>
           </ResponsiveContainer>
@@ -147,20 +156,10 @@ export const SecondaryCharts = ({ data }: SecondaryChartsProps) => {
                 tickLine={false}
                 tick={false}
               />
-              <YAxis yAxisId="rpm" hide domain={[0, 35]} />
-              <YAxis yAxisId="voltage" hide domain={[10, 16]} orientation="right" />
-              <Tooltip
-                contentStyle={{
-                  backgroundColor: 'hsl(var(--card))',
-                  border: '1px solid hsl(var(--border))',
-                  borderRadius: '6px',
-                }}
-                formatter={(value: number, name: string) => {
-                  if (name === 'rpm') return [`${(value * 100).toFixed(0)} RPM`, 'RPM'];
-                  return [`${value.toFixed(1)} V`, 'Voltage'];
-                }}
-              />
+              <YAxis yAxisId="rpm" hide domain={RPM_DOMAIN} />
+              <YAxis yAxisId="voltage" hide domain={VOLTAGE_DOMAIN} orientation="right" />
               <Line
+                isAnimationActive={false}
                 yAxisId="rpm"
                 type="monotone"
                 dataKey="rpm"
@@ -170,6 +169,7 @@ export const SecondaryCharts = ({ data }: SecondaryChartsProps) => {
                 strokeDasharray="5 5"
               />
               <Line
+                isAnimationActive={false}
                 yAxisId="voltage"
                 type="monotone"
                 dataKey="voltage"
@@ -1,3 +1,4 @@
+import { useMemo } from 'react';
 import { Card } from '@/components/ui/card';
 import { SensorData } from '@/types/scada';
 import {
@@ -11,20 +12,47 @@ import {
   ReferenceLine,
 } from 'recharts';
 
+// Static chart props hoisted so Recharts sees stable references across ticks
+const CHART_MARGIN = { top: 10, right: 10, left: 0, bottom: 0 };
+const AXIS_TICK = { fill: 'hsl(var(--muted-foreground))', fontSize: 11 };
+const TEMP_DOMAIN: [number, number] = [40, 120];
+const TOOLTIP_CONTENT_STYLE = {
+  backgroundColor: 'hsl(var(--card))',
+  border: '1px solid hsl(var(--border))',
+  borderRadius: '8px',
+  boxShadow: '0 4px 12px rgba(0,0,0,0.3)',
+};
+const TOOLTIP_LABEL_STYLE = { color: 'hsl(var(--muted-foreground))' };
+const TOOLTIP_ITEM_STYLE = { color: 'hsl(var(--primary))' };
+const ACTIVE_DOT = {
+  r: 6,
+  fill: 'hsl(var(--primary))',
+  stroke: 'hsl(var(--background))',
+  strokeWidth: 2,
+};
+
+const formatTempTick = (v: number) => `${v}°`;
+const formatTooltip = (value: number) => [`${value.toFixed(1)}°F`, 'Temperature'];
+
 interface TemperatureChartProps {
   data: SensorData[];
   currentTemp: number;
 }
 
 export const TemperatureChart = ({ data, currentTemp }: TemperatureChartProps) => {
-  const chartData = data.map((d, index) => ({
-    time: new Date(d.timestamp).toLocaleTimeString('en-US', {
-      hour: '2-digit',
-      minute: '2-digit',
-    }),
-    temperature: d.temperature,
-    index,
-  }));
+  // Rebuild the series only when history changes, not on every parent render
+  const chartData = useMemo(
+    () =>
+      data.map((d, index) => ({
+        time: new Date(d.timestamp).toLocaleTimeString('en-US', {
+          hour: '2-digit',
+          minute: '2-digit',
+        }),
+        temperature: d.temperature,
+        index,
+      })),
+    [data]
+  );
 
   const formatTime = (time: string, index: number) => {
     if (index % Math.max(1, Math.floor(chartData.length / 5)) === 0) {
@@ -53,7 +81,7 @@ export const TemperatureChart = ({ data, currentTemp }: TemperatureChartProps) =
 
       <div className="h-[280px] w-full">
         <ResponsiveContainer width="100%" height="100%">
-          <AreaChart data={chartData} margin={{ top: 10, right: 10, left: 0, bottom: 0 }}>
+          <AreaChart data={chartData} margin={CHART_MARGIN}>
             <defs>
               <linearGradient id="tempGradient" x1="0" y1="0" x2="0" y2="1">
                 <stop offset="0%" stopColor="hsl(var(--primary))" stopOpacity={0.4} />
@@ -69,27 +97,22 @@ export const TemperatureChart = ({ data, currentTemp }: TemperatureChartProps) =
               dataKey="time"
               axisLine={false}
               tickLine={false}
-              tick={{ fill: 'hsl(var(--muted-foreground))', fontSize: 11 }}
+              tick={AXIS_TICK}
               tickFormatter={formatTime}
               interval="preserveStartEnd"
             />
             <YAxis
-              domain={[40, 120]}
+              domain={TEMP_DOMAIN}
               axisLine={false}
               tickLine={false}
-              tick={{ fill: 'hsl(var(--muted-foreground))', fontSize: 11 }}
-              tickFormatter={(v) => `${v}°`}
+              tick={AXIS_TICK}
+              tickFormatter={formatTempTick}
             />
             <Tooltip
-              contentStyle={{
-                backgroundColor: 'hsl(var(--card))',
-                border: '1px solid hsl(var(--border))',
-                borderRadius: '8px',
-                boxShadow: '0 4px 12px rgba(0,0,0,0.3)',
-              }}
-              labelStyle={{ color: 'hsl(var(--muted-foreground))' }}
-              itemStyle={{ color: 'hsl(var(--primary))' }}
-              formatter={(value: number) => [`${value.toFixed(1)}°F`, 'Temperature']}
+              contentStyle={TOOLTIP_CONTENT_STYLE}
+              labelStyle={TOOLTIP_LABEL_STYLE}
+              itemStyle={TOOLTIP_ITEM_STYLE}
+              formatter={formatTooltip}
             />
             <ReferenceLine
               y={95}
@@ -110,12 +133,7 @@ export const TemperatureChart = ({ data, currentTemp }: TemperatureChartProps) =
               strokeWidth={2}
               fill="url(#tempGradient)"
               dot={false}
-              activeDot={{
-                r: 6,
-                fill: 'hsl(var(--primary))',
-                stroke: 'hsl(var(--background))',
-                strokeWidth: 2,
-              }}
+              activeDot={ACTIVE_DOT}
             />
           </AreaChart>
         </ResponsiveContainer>
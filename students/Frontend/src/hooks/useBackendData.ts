@@ -37,8 +37,10 @@ export function useBackendData({
   const healthCheckIntervalRef = useRef<number | null>(null);
   const fetchIntervalRef = useRef<number | null>(null);
 
-  // Fallback simulation hook
-  const simulatedController = useSimulatedData();
+  // Fallback simulation hook (only ticks while it can actually be used)
+  const simulatedController = useSimulatedData({
+    enabled: fallbackToSimulation && !isOnline,
+  });
 
   /**
    * Perform health check to see if backend is available
@@ -78,9 +80,10 @@ export function useBackendData({
       setError(apiErr);
       setIsLoading(false);
 
-      // Fallback to simulation on error
+      // Fallback to simulation on error. The simulation is paused while
+      // online, so take a fresh sample instead of its last (stale) one.
       if (fallbackToSimulation) {
-        const simData = simulatedController.currentData;
+        const simData = simulatedController.tick() ?? simulatedController.currentData;
         setData(simData);
         setIsSimulated(true);
       }
@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import { SensorData, Alert, EngineState } from '@/types/scada';
 
 const generateRandomValue = (base: number, variance: number) => {
@@ -79,8 +79,14 @@ const initialAlerts: Alert[] = [
   },
 ];
 
-export const useSimulatedData = () => {
+interface UseSimulatedDataOptions {
+  // When false the tick loop is paused, so an unused fallback does not re-render its host
+  enabled?: boolean;
+}
+
+export const useSimulatedData = ({ enabled = true }: UseSimulatedDataOptions = {}) => {
   const [tickCount, setTickCount] = useState(0);
+  const tickCountRef = useRef(0);
   const [currentData, setCurrentData] = useState<SensorData | null>(null);
   const [sensorHistory, setSensorHistory] = useState<SensorData[]>([]);
   const [alerts, setAlerts] = useState<Alert[]>(initialAlerts);
@@ -90,65 +96,67 @@ export const useSimulatedData = () => {
   const [hasError, setHasError] = useState(false);
   const [errorMessage, setErrorMessage] = useState<string | null>(null);
 
-  const tick = useCallback(() => {
+  // Generates one sample and returns it, so callers can use it synchronously
+  const tick = useCallback((): SensorData | null => {
     try {
       setHasError(false);
       setErrorMessage(null);
 
-      setTickCount((prev) => {
-        const newTick = prev + 1;
-        const prevTemp = currentData?.temperature ?? 75;
-        const newData = generateSensorData(newTick, prevTemp);
-        
-        setCurrentData(newData);
-        setSensorHistory((prevHistory) => {
-          const updated = [...prevHistory, newData];
-          return updated.slice(-300);
-        });
-
-        // Handle alert lifecycle based on state transitions
-        if (newData.state !== previousState) {
-          if (newData.state === 'NORMAL') {
-            // System recovered - add recovery alert
-            const recoveryAlert: Alert = {
-              id: Date.now().toString(),
-              timestamp: Date.now(),
-              message: 'System returned to normal operation',
-              source: 'Engine Monitor',
-              severity: 'INFO',
-            };
-            setAlerts((prev) => [recoveryAlert, ...prev].slice(0, 100));
-          } else if (newData.alert_message) {
-            // New alert triggered
-            const newAlert: Alert = {
-              id: Date.now().toString(),
-              timestamp: Date.now(),
-              message: newData.alert_message,
-              source: 'Engine Monitor',
-              severity: newData.state === 'CRITICAL' ? 'CRITICAL' : 'WARNING',
-            };
-            setAlerts((prev) => [newAlert, ...prev].slice(0, 100));
-          }
-          setPreviousState(newData.state);
-        }
+      const newTick = tickCountRef.current + 1;
+      tickCountRef.current = newTick;
+      const prevTemp = currentData?.temperature ?? 75;
+      const newData = generateSensorData(newTick, prevTemp);
 
-        return newTick;
+      setTickCount(newTick);
+      setCurrentData(newData);
+      setSensorHistory((prevHistory) => {
+        const updated = [...prevHistory, newData];
+        return updated.slice(-300);
       });
+
+      // Handle alert lifecycle based on state transitions
+      if (newData.state !== previousState) {
+        if (newData.state === 'NORMAL') {
+          // System recovered - add recovery alert
+          const recoveryAlert: Alert = {
+            id: Date.now().toString(),
+            timestamp: Date.now(),
+            message: 'System returned to normal operation',
+            source: 'Engine Monitor',
+            severity: 'INFO',
+          };
+          setAlerts((prev) => [recoveryAlert, ...prev].slice(0, 100));
+        } else if (newData.alert_message) {
+          // New alert triggered
+          const newAlert: Alert = {
+            id: Date.now().toString(),
+            timestamp: Date.now(),
+            message: newData.alert_message,
+            source: 'Engine Monitor',
+            severity: newData.state === 'CRITICAL' ? 'CRITICAL' : 'WARNING',
+          };
+          setAlerts((prev) => [newAlert, ...prev].slice(0, 100));
+        }
+        setPreviousState(newData.state);
+      }
+
+      return newData;
     } catch (error) {
       setHasError(true);
       setErrorMessage(
         error instanceof Error ? error.message : 'An unexpected error occurred'
       );
       console.error('Error in tick:', error);
+      return null;
     }
   }, [currentData?.temperature, previousState]);
 
   useEffect(() => {
-    if (!isRunning) return;
+    if (!isRunning || !enabled) return;
 
     const interval = setInterval(tick, 1500);
     return () => clearInterval(interval);
-  }, [isRunning, tick]);
+  }, [isRunning, enabled, tick]);
 
   useEffect(() => {
     tick();
@@ -165,6 +173,7 @@ export const useSimulatedData = () => {
     sensorHistory,
     alerts,
     tickCount,
+    tick,
     isRunning,
     setIsRunning,
     uptimeString,
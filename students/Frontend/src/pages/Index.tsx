@@ -24,15 +24,21 @@ import { Alert, SensorData, Report } from '@/types/scada';
 import { Button } from '@/components/ui/button';
 import { RotateCcw, Play, Pause, Zap, AlertCircle } from 'lucide-react';
 
+// Charts only ever show the most recent window, so cap the in-memory history
+const HISTORY_LIMIT = 300;
+
 const Index = () => {
   const [showSplash, setShowSplash] = useState(true);
   const [showScenarioTester, setShowScenarioTester] = useState(false);
   const [sensorHistory, setSensorHistory] = useState<SensorData[]>([]);
+  const [tickCount, setTickCount] = useState(0);
   const [alerts, setAlerts] = useState<Alert[]>([]);
   const [isLoading, setIsLoading] = useState(false);
   const [isPlaying, setIsPlaying] = useState(false);
   const [playSpeed, setPlaySpeed] = useState(1.0);
   const [faultMagnitude, setFaultMagnitude] = useState(0);
+  const sentFaultMagnitudeRef = useRef(0);
+  const [faultSlider, setFaultSlider] = useState<HTMLInputElement | null>(null);
   const [report, setReport] = useState<Report | null>(null);
   const [isReportLoading, setIsReportLoading] = useState(false);
   const playIntervalRef = useRef<NodeJS.Timeout | null>(null);
@@ -57,7 +63,8 @@ const Index = () => {
     await refetch();
     
     if (backendData) {
-      setSensorHistory((prev) => [...prev, backendData]);
+      setSensorHistory((prev) => [...prev.slice(1 - HISTORY_LIMIT), backendData]);
+      setTickCount((prev) => prev + 1);
 
       // Capture state change as alert with DTC codes
       if (backendData.state_changed && backendData.alert_message) {
@@ -88,9 +95,11 @@ const Index = () => {
     
     // Clear frontend state
     setSensorHistory([]);
+    setTickCount(0);
     setAlerts([]);
     setReport(null);
     setFaultMagnitude(0);
+    sentFaultMagnitudeRef.current = 0;
     
     // Call backend reset endpoint
     if (isOnline) {
@@ -108,28 +117,41 @@ const Index = () => {
     }
   }, [isOnline]);
 
-  // Fault Injection Slider
-  const handleFaultChange = useCallback(async (magnitude: number) => {
-    setFaultMagnitude(magnitude);
+  // Fault Injection Slider - dragging only updates the label; the value is
+  // sent to the backend once the slider is released
+  const handleFaultCommit = useCallback(async (magnitude: number) => {
+    if (!isOnline || magnitude === sentFaultMagnitudeRef.current) return;
     
     // Call backend to set fault injection
-    if (isOnline) {
-      try {
-        const response = await fetch(`${import.meta.env.VITE_API_URL || 'http://localhost:8000'}/fault`, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({ magnitude }),
-        });
-        
-        if (!response.ok) {
-          console.warn('Fault injection request failed:', response.status);
-        }
-      } catch (err) {
-        console.error('Failed to set fault injection:', err);
+    try {
+      const response = await fetch(`${import.meta.env.VITE_API_URL || 'http://localhost:8000'}/fault`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ magnitude }),
+      });
+      
+      if (response.ok) {
+        sentFaultMagnitudeRef.current = magnitude;
+      } else {
+        console.warn('Fault injection request failed:', response.status);
       }
+    } catch (err) {
+      console.error('Failed to set fault injection:', err);
     }
   }, [isOnline]);
 
+  // React's onChange fires on every drag step (DOM "input" event); the native
+  // "change" event fires once on release, wherever the pointer ends up.
+  // The slider is tracked via a callback ref since it mounts only after the
+  // splash and loading screens.
+  useEffect(() => {
+    if (!faultSlider) return;
+    
+    const handleChange = () => handleFaultCommit(parseFloat(faultSlider.value));
+    faultSlider.addEventListener('change', handleChange);
+    return () => faultSlider.removeEventListener('change', handleChange);
+  }, [faultSlider, handleFaultCommit]);
+
   // Generate Report
   const handleGenerateReport = useCallback(async () => {
     if (!isOnline) return;
@@ -244,8 +266,8 @@ const Index = () => {
     <div className="min-h-screen flex flex-col bg-background">
       <Header 
         isOnline={isOnline} 
-        tickCount={sensorHistory.length} 
-        uptime={`${Math.floor((sensorHistory.length * 0.5) / 60)}m`}
+        tickCount={tickCount} 
+        uptime={`${Math.floor((tickCount * 0.5) / 60)}m`}
         isSimulated={isSimulated}
       />
 
@@ -367,12 +389,13 @@ const Index = () => {
           </span>
           <div className="flex items-center gap-2 flex-1 max-w-xs">
             <input
+              ref={setFaultSlider}
               type="range"
               min="0"
               max="40"
               step="1"
               value={faultMagnitude}
-              onChange={(e) => handleFaultChange(parseFloat(e.target.value))}
+              onChange={(e) => setFaultMagnitude(parseFloat(e.target.value))}
               className="flex-1 h-2 bg-slate-700 rounded-lg appearance-none cursor-pointer accent-amber-500"
             />
             <span className={`text-xs font-mono w-12 text-right ${
@@ -383,7 +406,7 @@ const Index = () => {
           </div>
         </div>
 
-        <p className="text-xs text-slate-400 pl-8">Ticks: <span className="text-cyan-400 font-mono">{sensorHistory.length}</span> | Simulation Time: <span className="text-cyan-400 font-mono">{currentData?.simulation_time?.toFixed(1)}s</span></p>
+        <p className="text-xs text-slate-400 pl-8">Ticks: <span className="text-cyan-400 font-mono">{tickCount}</span> | Simulation Time: <span className="text-cyan-400 font-mono">{currentData?.simulation_time?.toFixed(1)}s</span></p>
       </div>
 
         {/* Status Banners */}
@@ -480,7 +503,7 @@ const Index = () => {
         <MLModelsPanel 
           mlInsights={currentData.ml_insights} 
           sensorData={currentData}
-          tickCount={sensorHistory.length}
+          tickCount={tickCount}
         />
 
         {/* ML Insights Section */}